@@ -75,6 +75,7 @@
 
     Animation
     Color
+        ImmutableColor
     Node
         Morph
             BlinkerMorph
@@ -106,7 +107,9 @@
             TriggerMorph
                 MenuItemMorph
     Point
+        ImmutablePoint
     Rectangle
+    WriteOnce
 
 
     II. toc
@@ -118,8 +121,11 @@
     Global functions
 
     Animation
+    WriteOnce
     Color
+    ImmutableColor
     Point
+    ImmutablePoint
     Rectangle
     Node
     Morph
@@ -1195,10 +1201,14 @@
     - Jens Mönig
 '''
 
-import math
+from copy import copy as _copy
+import functools
+from math import atan2, ceil, cos, floor, hypot, pi, sin, sqrt
+from numbers import Real
 import re
 import tkinter
 import time
+from types import SimpleNamespace
 
 ## Global settings #####################################################
 
@@ -1210,12 +1220,12 @@ morphicVersion = '2021-December-06'
 modules = {} # keep track of additional loaded modules
 useBlurredShadows = True
 
-ZERO = Point()
-BLACK = Color()
-WHITE = Color(255, 255, 255)
-CLEAR = Color(0, 0, 0, 0)
+def getMinimumFontHeight():
+    return 1
 
-standardSettings = {
+# settings are namespaces, e.g. MorphicPreferences.handleSize
+
+standardSettings = SimpleNamespace(**{
     "minimumFontHeight": getMinimumFontHeight(), # browser settings
     "globalFontFamily": '',
     "menuFontName": 'sans-serif',
@@ -1233,9 +1243,9 @@ standardSettings = {
     "isFlat": False,
     "grabThreshold": 5,
     "showHoles": False
-}
+})
 
-touchScreenSettings = {
+touchScreenSettings = SimpleNamespace(**{
     "minimumFontHeight": standardSettings.minimumFontHeight,
     "globalFontFamily": '',
     "menuFontName": 'sans-serif',
@@ -1253,7 +1263,7 @@ touchScreenSettings = {
     "isFlat": False,
     "grabThreshold": 5,
     "showHoles": False
-}
+})
 
 MorphicPreferences = standardSettings
 
@@ -1277,14 +1287,17 @@ def contains(list, element):
 def detect(list, predicate):
     # answer the first element of list for which predicate evaluates
     # True, otherwise answer None
-    for i in list:
-        if predicate(i):
-            return i
-    return None
+    return next(filter(predicate, list), None)
 
 def sizeOf(object):
     # answer the number of own properties
-    return len(dir(object))
+    if hasattr(object, '__dict__'):
+        return len(object.__dict__)
+    return sum(
+        hasattr(object, name)
+        for cls in type(object).__mro__
+        for name in getattr(cls, '__slots__', ())
+    )
 
 def isString(target):
     return isinstance(target, str)
@@ -1292,35 +1305,46 @@ def isString(target):
 def isObject(target):
     return target is not None and isinstance(target, object)
 
+RADIANS_PER_DEGREE = pi/180
+DEGREES_PER_RADIAN = 180/pi
+
 def radians(degrees):
-    return degrees*math.pi/180
+    return degrees*RADIANS_PER_DEGREE
 
 def degrees(radians):
-    return radians*180/math.pi
+    return radians*DEGREES_PER_RADIAN
 
 def fontHeight(height):
     minheight = max(height, MorphicPreferences.minimumFontHeight)
     return minheight * 1.2 # assuming 1/5 font size for ascenders
 
+# can't use \b or \w because they ignore diacritics
+_WORD_CHAR_RE = re.compile(r"[A-zÀ-ÿ0-9]")
+_URL_CHAR_RE = re.compile(r"[A-z0-9./:?&_+%-]")
+_URL_RE = re.compile(r"^https?://")
+
 def isWordChar(aCharacter):
-    # can't use \b or \w because they ignore diacritics
-    return re.match(r"[A-zÀ-ÿ0-9]", aCharacter)
+    return _WORD_CHAR_RE.match(aCharacter) is not None
 
 def isURLChar(aCharacter):
-    return re.match(r"[A-z0-9./:?&_+%-]", aCharacter)
+    return _URL_CHAR_RE.match(aCharacter) is not None
 
 def isURL(text):
-    return re.match(r"^https?://", text)
+    return _URL_RE.match(text) is not None
 
 def newCanvas(extentPoint=None, recycleMe=None):
+    # answer a canvas of the given extent, reusing and clearing recycleMe
+    # if it fits and isn't marked as shared via a truthy morphicShare
+    # attribute
+    if not isNil(recycleMe):
+        recycleExt = Point(recycleMe['width'], recycleMe['height'])
     if isNil(extentPoint):
-        ext = (math.ceil(Point(recycleMe.width, recycleMe.height) if
-               not isNil(recycleMe) else Point(0, 0)))
+        ext = recycleExt if not isNil(recycleMe) else Point(0, 0)
     else:
         ext = extentPoint
     if (not isNil(recycleMe) and
-        not recycleMe.dataset.morphicShare and
-        ext.x == recycleMe.width and ext.y == recycleMe.height):
+        not getattr(recycleMe, 'morphicShare', False) and
+        ext == recycleExt):
         canvas = recycleMe
         canvas.delete("all")
     else:
@@ -1338,17 +1362,24 @@ def copyCanvas(aCanvas=None):
         c.create_image(0, 0, image=aCanvas)
 '''
 
-def getMinimumFontHeight():
-    return 1
-
 def getDocumentPositionOf(aDOMelement):
     return {"x": 0, "y": 0}
 
+@functools.lru_cache(maxsize=4096)
+def hexColor(r, g, b):
+    # answer a Tk color string, e.g. '#ffa500', memoized because colors
+    # are converted on every render. Colors don't clamp their channels,
+    # so out-of-range values are clamped to [0, 255] here, where Tk
+    # would otherwise reject them
+    return '#%02x%02x%02x' % (
+        min(max(r, 0), 255),
+        min(max(g, 0), 255),
+        min(max(b, 0), 255)
+    )
+
 def copy(target):
-    from copy import copy
-    aCopy = copy(target)
-    del copy
-    return aCopy
+    # answer a shallow copy of target
+    return _copy(target)
 
 # Animations ###############################################################
 
@@ -1381,38 +1412,79 @@ def copy(target):
     are implemented.
 '''
 
+HALF_PI = pi/2 # a quarter turn, i.e. radians(90)
+
+# a few pre-defined easing functions used to transition two states
+
+# ease both in and out:
+
+def _easeLinear(t):
+    return t
+
+def _easeSinusoidal(t):
+    return 1-cos(t*HALF_PI)
+
+def _easeQuadratic(t):
+    return 2*t**2 if t<1/2 else 4*t-2*t**2-1
+
+def _easeCubic(t):
+    return 4*t**3 if t<1/2 else (t-1)*4*t**2-8*t-3
+
+def _easeElastic(t):
+    s = sin(50*t)
+    if t<1/2:
+        return s/100+s/(100*t)
+    return s/50-s/(100*t)+1
+
+# ease in only:
+
+def _easeSineIn(t):
+    return 1-sin(HALF_PI+t*HALF_PI)
+
+def _easeQuadIn(t):
+    return t**2
+
+def _easeCubicIn(t):
+    return t**3
+
+def _easeElasticIn(t):
+    return (1/25-1/(25*t))*sin(25*t)+1
+
+# ease out only:
+
+def _easeSineOut(t):
+    return sin(t*HALF_PI)
+
+def _easeQuadOut(t):
+    return t*(2-t)
+
+def _easeElasticOut(t):
+    return t/(25*(t-1))*sin(25*t)
+
 class Animation:
 
+    # dictionary of the pre-defined easing functions by name, shared by
+    # all instances
+    easings = {
+        "linear": _easeLinear,
+        "sinusoidal": _easeSinusoidal,
+        "quadratic": _easeQuadratic,
+        "cubic": _easeCubic,
+        "elastic": _easeElastic,
+        "sine_in": _easeSineIn,
+        "quad_in": _easeQuadIn,
+        "cubic_in": _easeCubicIn,
+        "elastic_in": _easeElasticIn,
+        "sine_out": _easeSineOut,
+        "quad_out": _easeQuadOut,
+        "elastic_out": _easeElasticOut
+    }
+
     # Animation instance creation:
 
     def __init__(self, setter, getter,
                  delta=0, duration=0,
                  easing=None, onComplete=None):
-        self.easings = {
-            # dictionary of a few pre-defined easing functions used to
-            # transition two states
-
-            # ease both in and out:
-            "linear": lambda t: t,
-            "sinusoidal": lambda t: 1-math.cos(radians(t*90)),
-            "quadratic": lambda t: (2*t**2 if t<1/2 else 4*t-2*t**2-1),
-            "cubic": lambda t: (4*t**3 if t<1/2 else (t-1)*4*t**2-8*t-3),
-            "elastic": lambda t: ((math.sin(50*t))/100+
-                                  (math.sin(50*t))/(100*t) if t<1/2
-                                  else (math.sin(50*t))/50-
-                                       (math.sin(50*t))/(100*t)+1),
-
-            # ease in only:
-            "sine_in": lambda t: 1-math.sin(radians(90+(t*90))),
-            "quad_in": lambda t: t**2,
-            "cubic_in": lambda t: t**3,
-            "elastic_in": lambda t: (1/25-1/(25*t))*math.sin(25*t)+1,
-
-            # ease out only:
-            "sine_out": lambda t: math.sin(radians(t*90)),
-            "quad_out": lambda t: t*(2-t),
-            "elastic_out": lambda t: t/(25*(t-1))*math.sin(25*t)
-        }
         self.setter = setter # function
         self.getter = getter # function
         self.delta = delta # number
@@ -1421,12 +1493,12 @@ class Animation:
             if easing in self.easings:
                 self.easing = self.easings[easing]
             else:
-                self.easing = self.easings.sinusoidal
+                self.easing = self.easings["sinusoidal"]
         else:
             if not isNil(easing):
                 self.easing = easing
             else:
-                self.easing = self.easings.sinusoidal
+                self.easing = self.easings["sinusoidal"]
         self.onComplete = onComplete # optional callback
         self.endTime = None
         self.destination = None
@@ -1437,27 +1509,67 @@ class Animation:
         # (re-) activate the animation, e.g. if is has previously completed,
         # make sure to plug it into something that repeatedly triggers
         # step(), e.g. the World's animations queue
-        self.endTime = time.time_ns()//1000000
-        self.destination = self.getter(self) + self.delta
+        self.endTime = time.monotonic_ns()//1000000 + self.duration
+        self.destination = self.getter() + self.delta
         self.isActive = True
 
-    def step(self):
+    def step(self, now=None):
+        # now is the current time in milliseconds on the monotonic clock.
+        # schedulers stepping several animations per display cycle should
+        # sample it once and pass it to each of them
         if not self.isActive: return
-        now = time.time_ns()//1000000
-        if now > self.endTime:
+        if isNil(now):
+            now = time.monotonic_ns()//1000000
+        endTime = self.endTime
+        if now >= endTime:
             self.setter(self.destination)
             self.isActive = False
             if not isNil(self.onComplete): self.onComplete()
         else:
             self.setter(
                 self.destination -
-                self.delta*self.easing((self.endTime-now)/self.duration)
+                self.delta*self.easing((endTime-now)/self.duration)
             )
 
+# Write-once values ########################################################
+
+class WriteOnce:
+
+    # I am a mixin for value classes whose attributes can be set only
+    # once, by __init__, so a single instance can be shared safely, e.g.
+    # as ZERO or BLACK. copies, deep copies and unpickled instances are
+    # plain mutable values again, answered by the value class' copy()
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"can't change {name} of {self!r}")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"can't delete {name} of {self!r}")
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __reduce__(self):
+        aCopy = self.copy()
+        return aCopy.__class__, tuple(
+            getattr(aCopy, name) for name in aCopy.__slots__
+        )
+
 # Colors ###################################################################
 
+TOLERANCE_SCALE = 64/25 # 256 channel values per 100 percent
+
 class Color:
 
+    __slots__ = ('r', 'g', 'b', 'a')
+
     # Color instance creation:
 
     def __init__(self, r=0, g=0, b=0, a=1):
@@ -1465,23 +1577,22 @@ class Color:
         self.r = int(r)
         self.g = int(g)
         self.b = int(b)
-        self.a = int(a)
+        self.a = float(a) # opacity within [0, 1]
 
-    # Color string representation: e.g. 'Color(255, 165, 0, 1)'
+    # Color string representation: e.g. 'Color(255, 165, 0, 1.0)'
     def __repr__(self):
-        return (
-            'Color(' +
-            self.r + ', ' +
-            self.g + ', ' +
-            self.b + ', ' +
-            self.a + ')'
-        )
+        return f'Color({self.r}, {self.g}, {self.b}, {self.a})'
+
+    # Color Tk representation: e.g. '#ffa500'
+    def __str__(self):
+        return hexColor(self.r, self.g, self.b)
 
     @classmethod
     def fromString(cls, aString):
-        # I parse rgb/rgba strings into a Color object
-        components = re.split(r"[\(), ]", aString)[1:5]
-        return Color(*components)
+        # I parse rgb/rgba strings, e.g. 'rgba(255, 165, 0, 0.5)', into a
+        # Color object
+        inner = aString[aString.index('(')+1:aString.rindex(')')]
+        return Color(*map(float, inner.split(',')))
 
     # Color copying:
     def copy(self):
@@ -1494,29 +1605,30 @@ class Color:
 
     # Color comparison:
     def __eq__(self, other):
-        return (
+        return self is other or (
             isinstance(other, Color) and
-            self.r == other.r and
-            self.g == other.g and
-            self.b == other.b and
-            self.a == other.a
+            (self.r, self.g, self.b, self.a) ==
+            (other.r, other.g, other.b, other.a)
         )
 
+    def __hash__(self):
+        # equal colors hash alike, so they can be used as dictionary keys.
+        # Colors are mutable, though: don't change one while it's a key or
+        # set member, or it won't be found again. use a copy, or the
+        # write-once ImmutableColor, instead
+        return hash((self.r, self.g, self.b, self.a))
+
     def isCloseTo(self, other, tolerance=10):
         # experimental - answer whether a color is "close" to another one by
         # a given percentage. tolerance is the percentage by which each
         # color channel may diverges
-        threshold = 64/25 * tolerance
-
-        def dist(a, b):
-            return abs(a-b)
-
+        if not isinstance(other, Color): return False
+        threshold = TOLERANCE_SCALE * tolerance
         return (
-            isinstance(other, Color) and
-            dist(self.r, other.r) < threshold and
-            dist(self.g, other.g) < threshold and
-            dist(self.b, other.b) < threshold and
-            dist(self.a, other.a) < threshold
+            abs(self.r-other.r) < threshold and
+            abs(self.g-other.g) < threshold and
+            abs(self.b-other.b) < threshold and
+            abs(self.a-other.a) < threshold
         )
 
     # Color conversion (hsva):
@@ -1527,30 +1639,23 @@ class Color:
         bb = b/255
         max_ = max(rr, gg, bb)
         min_ = min(rr, gg, bb)
-        h = max_
-        s = max_
         v = max_
         d = max_ - min_
         s = 0 if max_ == 0 else d/max_
         if max_ == min_:
             h = 0
         else:
-            if max == rr:
-                h = (gg-bb)/d+(6 if gg<bb else 0)
-            elif max_ == gg:
-                h = (bb-rr)/d+2
-            elif max_ == bb:
-                h = (rr-gg)/d+4
-            else:
-                raise Exception("This error should never be raised. "
-                                "Please report this as a bug.")
-            h /= 6
+            # i is 0, 1 or 2 for a red, green or blue maximum, whose hue
+            # sectors start at 0, 2 and 4 sixths; "% 1" wraps negative
+            # red hues around like adding 6 sixths would
+            i = (rr, gg, bb).index(max_)
+            h = ((gg-bb, bb-rr, rr-gg)[i]/d + 2*i)/6 % 1
         return (h, s, v, a)
 
     @classmethod
     def hsva_rgba(cls, h=0, s=0, v=0, a=1):
         # h, s, v, and a are to be within [0, 1]
-        i = math.floor(h*6)
+        i = floor(h*6)
         f = h*6-i
         p = v*(1-s)
         q = v*(1-f*s)
@@ -1690,25 +1795,41 @@ class Color:
             self.b
         )
 
+class ImmutableColor(WriteOnce, Color):
+    __slots__ = ()
+
+BLACK = ImmutableColor()
+WHITE = ImmutableColor(255, 255, 255)
+CLEAR = ImmutableColor(0, 0, 0, 0)
+
 # Points ###################################################################
 
 class Point:
 
+    __slots__ = ('x', 'y')
+
     # Point instance creation:
 
     def __init__(self, x=0, y=0):
-        self.x = int(float(x))
-        self.y = int(float(y))
+        # coordinates are integers, only convert when they aren't already
+        self.x = x if type(x) is int else int(x)
+        self.y = y if type(y) is int else int(y)
+
+    @classmethod
+    def fromString(cls, aString):
+        # I parse strings such as '12@68' or '12.5@68' into a Point object
+        x, y = aString.split('@')
+        return Point(float(x), float(y))
 
     # Point string representation:
 
     # repr, e.g. 'Point(12, 68)'
     def __repr__(self):
-        return "Point(" + str(self.x) + ", " + str(self.y) + ")"
+        return f"Point({self.x}, {self.y})"
 
     # str, e.g. '12@68'
     def __str__(self):
-        return str(self.x) + "@" + str(self.y)
+        return f"{self.x}@{self.y}"
 
     # Point copying:
     def copy(self):
@@ -1716,12 +1837,18 @@ class Point:
 
     # Point comparison:
     def __eq__(self, other):
-        return (
+        return self is other or (
             isinstance(other, Point) and
-            self.x == other.x and
-            self.y == other.y
+            (self.x, self.y) == (other.x, other.y)
         )
 
+    def __hash__(self):
+        # equal points hash alike, so they can be used as dictionary keys.
+        # Points are mutable, though: don't change one while it's a key or
+        # set member, or it won't be found again. use a copy, or the
+        # write-once ImmutablePoint, instead
+        return hash((self.x, self.y))
+
     def __lt__(self, other):
         return (
             isinstance(other, Point) and
@@ -1767,7 +1894,12 @@ class Point:
         return self
 
     # Point conversion:
+    # rounding an integer Point, i.e. the usual case since coordinates
+    # are coerced to int, changes nothing and just answers a copy, since
+    # Points are mutable and mustn't be shared with the caller
     def __round__(self, ndigits=0):
+        if ndigits >= 0 and type(self.x) is int and type(self.y) is int:
+            return self.copy()
         return Point(
             round(self.x, ndigits),
             round(self.y, ndigits)
@@ -1785,155 +1917,213 @@ class Point:
             -self.y
         )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def reflectionMatrix(x, y):
+        # answer the numerators (a, b) and the denominator n of the matrix
+        # ((a, b), (b, -a)) / n reflecting across the line through the
+        # origin and x@y. they're kept apart so that integer axes reflect
+        # exactly and only divide once, at the end
+        return x*x - y*y, 2*x*y, x*x + y*y
+
     def mirror(self, axis=None):
-        if not isinstance(axis, Point):
-            axis = Point(1, 1)
-        axis = abs(axis)
-        vx, vy = axis.asTuple
-        x, y = -self.asTuple
-        r = 1/axis.dot(axis)
+        # answer my reflection across the line through the origin and
+        # axis, by default the diagonal, i.e. with x and y swapped, e.g.
+        # (10@5).mirror(3@4) answers 2@11 and (-1@-3).mirror(2@1) -3@1
+        if not isinstance(axis, Point) or axis.x == axis.y != 0:
+            return Point(self.y, self.x)
+        if axis.x == 0 and axis.y == 0:
+            raise ValueError("can't mirror across a zero-length axis")
+        a, b, n = Point.reflectionMatrix(axis.x, axis.y)
         return Point(
-            self.x+2*(x-(x*vx-y*vy)*r*vx),
-            self.y+2*(y-(y*vy-x*vx)*r*vy)
+            (a*self.x + b*self.y) / n,
+            (b*self.x - a*self.y) / n
         )
 
     def __floor__(self):
+        if type(self.x) is int and type(self.y) is int:
+            return self.copy()
         return Point(
-            math.floor(self.x),
-            math.floor(self.y)
+            floor(self.x),
+            floor(self.y)
         )
 
     def __ceil__(self):
+        if type(self.x) is int and type(self.y) is int:
+            return self.copy()
         return Point(
-            math.ceil(self.x),
-            math.ceil(self.y)
+            ceil(self.x),
+            ceil(self.y)
         )
 
     # Point arithmetic:
+
+    # operands are checked by exact class first, which is cheaper than
+    # isinstance() for plain Points and the usual int and float scalars.
+    # reflected operations never see a Point on the left, that Point's
+    # own operation handles it. other operand types answer NotImplemented
+    # so Python can try their reflected operation instead
+
     def __add__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point or isinstance(other, Point):
             return Point(self.x+other.x, self.y+other.y)
-        return Point(self.x+other, self.y+other)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(self.x+other, self.y+other)
+        return NotImplemented
 
     def __sub__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point or isinstance(other, Point):
             return Point(self.x-other.x, self.y-other.y)
-        return Point(self.x-other, self.y-other)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(self.x-other, self.y-other)
+        return NotImplemented
 
     def __mul__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point or isinstance(other, Point):
             return Point(self.x*other.x, self.y*other.y)
-        return Point(self.x*other, self.y*other)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(self.x*other, self.y*other)
+        return NotImplemented
 
     def __truediv__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point or isinstance(other, Point):
             return Point(self.x/other.x, self.y/other.y)
-        return Point(self.x/other, self.y/other)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(self.x/other, self.y/other)
+        return NotImplemented
 
     __div__ = __truediv__
 
     def __floordiv__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point or isinstance(other, Point):
             return Point(self.x//other.x, self.y//other.y)
-        return Point(self.x//other, self.y//other)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(self.x//other, self.y//other)
+        return NotImplemented
 
     def __mod__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point or isinstance(other, Point):
             return Point(self.x%other.x, self.y%other.y)
-        return Point(self.x%other, self.y%other)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(self.x%other, self.y%other)
+        return NotImplemented
 
-    def __radd__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x+other.x, self.y+other.y)
-        return Point(self.x+other, self.y+other)
+    __radd__ = __add__ # commutative
 
     def __rsub__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point:
             return Point(other.x-self.x, other.y-self.y)
-        return Point(other-self.x, other-self.y)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(other-self.x, other-self.y)
+        return NotImplemented
 
-    def __rmul__(self, other):
-        if isinstance(other, Point):
-            return Point(other.x*self.x, other.y*self.y)
-        return Point(other*self.x, other*self.y)
+    __rmul__ = __mul__ # commutative
 
     def __rtruediv__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point:
             return Point(other.x/self.x, other.y/self.y)
-        return Point(other/self.x, other/self.y)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(other/self.x, other/self.y)
+        return NotImplemented
 
     __rdiv__ = __rtruediv__
 
     def __rfloordiv__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point:
             return Point(other.x//self.x, other.y//self.y)
-        return Point(other//self.x, other//self.y)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(other//self.x, other//self.y)
+        return NotImplemented
 
     def __rmod__(self, other):
-        if isinstance(other, Point):
+        cls = other.__class__
+        if cls is Point:
             return Point(other.x%self.x, other.y%self.y)
-        return Point(other%self.x, other%self.y)
+        if cls is int or cls is float or isinstance(other, Real):
+            return Point(other%self.x, other%self.y)
+        return NotImplemented
 
     # Point polar coordinates:
     @property
     def r(self):
-        return math.sqrt(self.dot(self))
+        return hypot(self.x, self.y)
 
     @property
     def theta(self):
-        if self.x == 0:
-            if self.y == 0:
-                return 0
-            return 90
-        return degrees(math.atan(self.y/self.x))
+        # answer my angle in radians, in all four quadrants
+        return atan2(self.y, self.x)
 
     @classmethod
     def theta_r_to_x_y(cls, theta, r):
+        # rounded, not truncated, so e.g. theta_r_to_x_y(atan2(4, 3), 5)
+        # answers 3@4 although sin(theta)*r comes out as 3.9999999999999996
         return Point(
-            math.cos(theta),
-            math.sin(theta)
-        ) * r
+            round(cos(theta)*r),
+            round(sin(theta)*r)
+        )
 
     # Point functions:
     def __cross__(self, other):
-        if isinstance(other, Point):
-            stom = self * other.mirror()
-            return stom.x-stom.y
+        # 2D scalar cross product
+        if other.__class__ is Point or isinstance(other, Point):
+            return self.x*other.y - self.y*other.x
         return NotImplemented
 
     cross = __cross__
 
     def __dot__(self, other):
-        if isinstance(other, Point):
-            sto = self * other
-            return sto.x + sto.y
+        if other.__class__ is Point or isinstance(other, Point):
+            return self.x*other.x + self.y*other.y
         return NotImplemented
 
     dot = __dot__
 
+    # batched versions for many points in separate x and y arrays, e.g.
+    # NumPy arrays, which support elementwise arithmetic:
+
+    @classmethod
+    def dotBatch(cls, xs, ys, oxs, oys):
+        return xs*oxs + ys*oys
+
+    @classmethod
+    def crossBatch(cls, xs, ys, oxs, oys):
+        return xs*oys - ys*oxs
+
     def distanceTo(self, other):
-        return (other-self).r
+        return hypot(other.x-self.x, other.y-self.y)
 
     def rotate(self, amount):
-        return Point.theta_r_to_x_y(self.theta + amount, self.r)
+        # answer me rotated by amount radians around the origin, rounded
+        # like theta_r_to_x_y() so that quarter turns land exactly
+        c = cos(amount)
+        s = sin(amount)
+        return Point(
+            round(self.x*c - self.y*s),
+            round(self.x*s + self.y*c)
+        )
 
-    flip = mirror
+    flip = mirror # without an axis, swaps x and y
 
-    # I don't know what this does.
     def distanceAngle(self, dist, angle):
-        deg = angle
-        while not -270 < deg < 270:
-            if deg > 270:
-                deg -= 360
-            elif deg < -270:
-                deg += 360
+        # answer the point dist away from me in the direction of angle,
+        # in degrees clockwise from straight up (screen y grows downwards)
+        deg = 180 - (180 - angle) % 360 # normalized to (-180, 180]
         if -90 <= deg <= 90:
-            x = math.sin(radians(deg)) * dist
-            y = Point(dist, x).r
-            return Point(x + self.x, y - self.y)
-        x = math.sin(radians(180 - deg)) * dist
-        y = Point(dist, x).r
-        return Point(x + self.x, y + self.y)
+            x = sin(radians(deg)) * dist
+            y = sqrt(dist*dist - x*x)
+            return Point(x + self.x, self.y - y)
+        x = sin(radians(180 - deg)) * dist
+        y = sqrt(dist*dist - x*x)
+        return Point(x + self.x, self.y + y)
 
     # Point transformation:
     def scale(self, scale):
@@ -1947,10 +2137,16 @@ class Point:
     def asTuple(self):
         return self.x, self.y
 
+    # answers a new list on every access, prefer asTuple unless the
+    # result has to be mutable
     @property
     def asList(self):
         return [self.x, self.y]
 
     def __iter__(self):
-        yield self.x
-        yield self.y
+        return iter((self.x, self.y))
+
+class ImmutablePoint(WriteOnce, Point):
+    __slots__ = ()
+
+ZERO = ImmutablePoint()